@@ -0,0 +1,10 @@
+"""See `hooks.block_manual_req_edits`"""
+
+from __future__ import annotations
+
+from useful_types import SequenceNotStr as Sequence
+
+from .hooks.block_manual_req_edits import block_manual_req_edits
+
+if __name__ == "__main__":
+    block_manual_req_edits()
@@ -49,13 +49,8 @@ def find_insertion_point(mod: ast.Module) -> NodeLoc | None:
         - If present, `from __future__ import annotations` is the very first import statement in a module.
         - Docstring is not preceded by any other lines.
     """
-    # fmt: off
-    docstring_offset = (
-        0
-        if not ast.get_docstring(mod)
-        else cast(int, mod.body[0].end_lineno)
-    )
-    # fmt: on
+    has_docstring = bool(ast.get_docstring(mod))
+    docstring_offset = cast(int, mod.body[0].end_lineno) if has_docstring else 0
 
     for idx, node in enumerate(mod.body):
         if isinstance(node, ast.ImportFrom):
@@ -65,7 +60,7 @@ def find_insertion_point(mod: ast.Module) -> NodeLoc | None:
                 idx,
                 node.lineno + docstring_offset,
             )
-    idx = 0 if not ast.get_docstring(mod) else 1
+    idx = 1 if has_docstring else 0
 
     return NodeLoc(idx, docstring_offset)
 
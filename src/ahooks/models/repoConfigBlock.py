@@ -32,7 +32,7 @@ class HookConfigBlockProto(Protocol):
     files: str | None = attr.field(default=None)
     stages: tuple[GitStage, ...] | None = attr.field(default=None)
     _repo: RepoConfigBlock
-    _funcs: set[Callable[..., Any]]
+    _funcs: list[Callable[..., Any]]
 
 
 @attr.define
@@ -53,7 +53,8 @@ class RepoConfigBlock:
     def has_hook(self, hook: HookConfigBlockProto) -> bool:
         """Checks if a hook of the same id is already in the hook list"""
         has_ = any(h.id == hook.id for h in self.hooks)
-        logger.debug(msg=tuple(h.id for h in self.hooks))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(msg=tuple(h.id for h in self.hooks))
         return has_
 
     @override
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from subprocess import CompletedProcess
+from typing import Any
 
 import click
 from useful_types import SequenceNotStr as Sequence
@@ -20,14 +21,14 @@ class SubprocessReturnCodeException(click.ClickException):
     def __init__(
         self,
         command_name: str,
-        subprocess: CompletedProcess[str],
+        subprocess: CompletedProcess[Any],
     ) -> None:
         super().__init__(
             f"`{command_name}` failed with exit code {subprocess.returncode}."
         )
 
 
-def raise_if_return_code(command_name: str, result: CompletedProcess[str]) -> None:
+def raise_if_return_code(command_name: str, result: CompletedProcess[Any]) -> None:
     if result.returncode != 0:
         raise SubprocessReturnCodeException(command_name, result)
 
@@ -1,28 +1,26 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Protocol, runtime_checkable
 
 from useful_types import SequenceNotStr as Sequence
 
 
-@runtime_checkable
-class HasWrite(Protocol):
-    """Proto for files or buffer"""
-
-    def write(self, s: str, /) -> int: ...
-
-
-def write_(f: HasWrite, s: str) -> None:
-    """Write wrapper to placate pyright"""
-    f.write(s)  # pyright: ignore[reportUnusedCallResult]
-
-
 def write_atomic(path: Path, new_content: str) -> None:
-    """Write to tmp first, then replace."""
+    """Write to tmp first, then replace.
+
+    Encodes once and writes straight to the file descriptor (no text/buffered layers).
+    """
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8", newline="\n") as f:
-        write_(f, new_content)
+    payload = memoryview(new_content.encode("utf-8"))
+    ## `O_BINARY` (Windows only) keeps the CRT from turning `\n` into `\r\n`: output is always LF
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp, flags, 0o666)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload) :]
+    finally:
+        os.close(fd)
     _ = tmp.replace(path)
 
 
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import os
+import re
 import subprocess
 import warnings
 from collections.abc import Callable, Collection, Iterable
@@ -13,6 +15,11 @@ from typing import Annotated, Any, Literal, TypeAlias, TypeVar
 from typing_extensions import LiteralString, Self, override
 from useful_types import SequenceNotStr as Sequence
 
+try:
+    import pygit2
+except ImportError:  # optional dependency: `ahooks[libgit2]`
+    pygit2 = None  # type: ignore[assignment]
+
 Ignores: TypeAlias = Annotated[
     Collection[str] | Collection[Path],
     "Collection of files or directories for this hook to skip.",
@@ -26,7 +33,7 @@ class GitSubProcessFailed(Exception):
     def __init__(
         self,
         cmd_args: Collection[str],
-        res: subprocess.CompletedProcess[str],
+        res: subprocess.CompletedProcess[bytes],
         *args: Any,
         **kwargs: Any,
     ) -> None:
@@ -40,14 +47,40 @@ class GitSubProcessFailed(Exception):
             *args: Additional positional arguments passed to Exception.
             **kwargs: Additional keyword arguments passed to Exception.
         """
-        msg = f"git {' '.join(cmd_args)} failed:\n{res.stderr.strip()}"
+        ## Output is captured as bytes; only the failure path pays for a decode
+        stderr = res.stderr.decode("utf-8", "replace").strip()
+        msg = f"git {' '.join(cmd_args)} failed:\n{stderr}"
         super().__init__(msg, *args, **kwargs)
 
 
-def run_git(cwd: Path, *args: str) -> str:
-    """Main runner for git commands"""
-    res = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)  # noqa: S607
-    if res.returncode != 0:
+def run_git(
+    cwd: Path,
+    *args: str,
+    stdin: bytes | None = None,
+    ok_codes: Collection[int] = (0,),
+) -> bytes:
+    """Main runner for git commands
+
+    Arguments:
+        cwd : Path
+            Directory to run git from.
+        *args : str
+            Git subcommand and its arguments.
+        stdin : bytes, optional
+            Fed to the process (for commands which take ``--stdin``).
+        ok_codes : Collection[int], default=(0,)
+            Return codes which aren't failures (e.g. `git check-ignore` exits 1 when nothing matched).
+
+    Returns:
+        bytes : The raw stdout. Callers split it (e.g. on NUL) and decode only what they keep.
+    """
+    res = subprocess.run(
+        ["git", *args],  # noqa: S607
+        cwd=cwd,
+        input=stdin,
+        capture_output=True,
+    )
+    if res.returncode not in ok_codes:
         raise GitSubProcessFailed(args, res)
     return res.stdout
 
@@ -61,15 +94,120 @@ def git_add(*path: Path) -> None:
     )
 
 
-@lru_cache
+class _Libgit2Backend:
+    """Answer the read-only queries in this module in-process with libgit2.
+
+    Opt-in: only used if the optional `pygit2` is installed and ``AHOOKS_LIBGIT2=1`` is set;
+    each query then skips a `git` subprocess. Opened repositories are cached per repo root.
+    """
+
+    def __init__(self) -> None:
+        self._repos: dict[Path, pygit2.Repository] = {}
+
+    def _repo(self, root: Path) -> pygit2.Repository:
+        try:
+            return self._repos[root]
+        except KeyError:
+            repo = self._repos[root] = pygit2.Repository(str(root))
+            return repo
+
+    def clear(self) -> None:
+        """Drop the opened repositories"""
+        self._repos.clear()
+
+    def discover(self, start: Path) -> Path | None:
+        """Root of the (non-bare) repository containing ``start``"""
+        git_dir = pygit2.discover_repository(str(start))
+        if git_dir is None:
+            return None
+        repo = pygit2.Repository(git_dir)
+        if repo.workdir is None:
+            return None
+        root = Path(repo.workdir)
+        _ = self._repos.setdefault(root, repo)
+        return root
+
+    def is_ignored(self, root: Path, path: PathLike) -> bool:
+        """Same as `git check-ignore` run from ``root``: tracked files are never ignored"""
+        repo = self._repo(root)
+        rel = _repo_relpath(root, path)
+        return rel not in repo.index and repo.path_is_ignored(rel)
+
+    def staged_names(self, root: Path, diff_filter: DiffFilter) -> list[str] | None:
+        """Same as `git diff --cached --name-only`, or None if HEAD is unborn"""
+        repo = self._repo(root)
+        if repo.head_is_unborn:
+            return None
+        diff = repo.diff("HEAD", cached=True)
+        ## `git diff` detects renames by default
+        diff.find_similar()
+        return [
+            d.new_file.path for d in diff.deltas if d.status_char() in diff_filter.flags
+        ]
+
+
+def _repo_relpath(root: Path, path: PathLike) -> str:
+    """``path`` as the normalized POSIX path relative to ``root`` that libgit2 (and the index) expects.
+
+    Accepts what `git check-ignore` does: absolute paths, and spellings like `./a` or `sub/../a`.
+    """
+    joined = os.path.normpath(os.path.join(root, path))
+    ## Resolve the parent so a symlinked spelling of ``root`` still lands inside it
+    parent, name = os.path.split(joined)
+    rel = Path(os.path.relpath(os.path.join(os.path.realpath(parent), name), root))
+    suffix = "/" if str(path).endswith(("/", os.sep)) else ""
+    return rel.as_posix() + suffix
+
+
+_libgit2: _Libgit2Backend | None = (
+    _Libgit2Backend()
+    if pygit2 is not None and os.environ.get("AHOOKS_LIBGIT2") == "1"
+    else None
+)
+
+
+def _libgit2_backend() -> _Libgit2Backend | None:
+    """The libgit2 backend, unless git pointed this process at another index.
+
+    Git sets ``GIT_INDEX_FILE`` for hooks run by `git commit -a` / `git commit <path>`;
+    pygit2 always reads `.git/index`, so those fall back to the `git` CLI.
+    """
+    if "GIT_INDEX_FILE" in os.environ:
+        return None
+    return _libgit2
+
+
+## realpath of a start directory -> its repo root. Cleared by `clear_git_caches`
+_REPO_ROOT_CACHE: dict[str, Path] = {}
+
+
 def find_repo_root(start: Path) -> Path:
-    """Find the .git repo root from a starting directory"""
+    """Find the .git repo root from a starting directory
+
+    The lookup is memoized on ``os.path.realpath(start)``, so `Path(".")`, relative,
+    absolute and symlinked spellings of the same directory share one cache entry.
+    """
+    key = os.path.realpath(start)
     try:
-        out = run_git(start, "rev-parse", "--show-toplevel")
-        return Path(out.strip())
+        return _REPO_ROOT_CACHE[key]
+    except KeyError:
+        root = _REPO_ROOT_CACHE[key] = _find_repo_root(key)
+        return root
+
+
+def _find_repo_root(start: str) -> Path:
+    ## A stat per level covers regular repos, worktrees and submodules (where `.git` is a file)
+    for ancestor in (p := Path(start), *p.parents):
+        if (ancestor / ".git").exists():
+            return ancestor
+    if _libgit2 is not None:
+        return _libgit2.discover(Path(start)) or Path(start)
+    try:
+        out = run_git(Path(start), "rev-parse", "--show-toplevel")
+        return Path(os.fsdecode(out.strip()))
     except Exception:
         # Fallback: assume provided root is the repo root
-        return start
+        return Path(start)
 
 
 DiffFilterType = Literal["A", "C", "M", "R", "T", "U", "X", "B", "D"]
@@ -86,6 +224,7 @@ class DiffFilter:
             Collection of argument flags: "A", "C", "M", "R", "T", "U", "X", "B", "D"
         """
         self._cmd: LiteralString = f"--diff-filter={''.join(args)}"
+        self.flags: frozenset[str] = frozenset(args)
 
     @override
     def __str__(self) -> str:
@@ -174,28 +313,53 @@ def iter_py_git_diff(
         Iterable[Path] :
             Absolute paths to `.py` files matching your diff-filter criteria.
     """
-    repo_root: Path = find_repo_root(root)
+    yield from iter_py_git_diff_at(
+        find_repo_root(root),
+        staging_area=staging_area,
+        working_tree=working_tree,
+        base=base,
+        diff_filter=diff_filter,
+    )
 
-    def _cmd(*args: str) -> str:
-        return run_git(repo_root, "diff", "--name-only", str(diff_filter), *args)
+
+def iter_py_git_diff_at(
+    repo_root: Path,
+    *,
+    staging_area: bool = True,
+    working_tree: bool = False,
+    base: str | None = None,
+    diff_filter: DiffFilter = IGNORE_DELETE,
+) -> Iterable[Path]:
+    """Same as ``iter_py_git_diff``, for callers who already resolved ``repo_root`` with ``find_repo_root``"""
+
+    def _cmd(*args: str) -> list[str]:
+        out = run_git(repo_root, "diff", "--name-only", "-z", str(diff_filter), *args)
+        ## Only the `.py` names are ever used, so only those get decoded
+        return [os.fsdecode(n) for n in out.split(b"\0") if n.endswith(b".py")]
+
+    def _staged(*args: str) -> list[str]:
+        if (
+            not args
+            and (backend := _libgit2_backend()) is not None
+            and (names := backend.staged_names(repo_root, diff_filter)) is not None
+        ):
+            return names
+        return _cmd("--cached", *args)
 
     if base:
-        args = ("--cached", base) if staging_area else (base,)
-        out = _cmd(*args)
+        names = _staged(base) if staging_area else _cmd(base)
     elif working_tree:
-        out = _cmd()
-    elif staging_area:
-        out = _cmd("--cached")
+        names = _cmd()
     else:
         # default to staged files
-        out = _cmd("--cached")
+        names = _staged()
 
-    # fmt: off
-    for rel in out.splitlines():
-        if rel.endswith(".py") \
-        and (p := (root / rel).absolute()).exists():
-            yield p
-    # fmt: on
+    ## Paths from git are relative to the repo root, and `diff_filter` already drops deletions:
+    # canonicalize the root once rather than `.resolve()`-ing each file
+    root_real = Path(os.path.realpath(repo_root))
+    for rel in names:
+        if rel.endswith(".py"):
+            yield root_real / rel
 
 
 def iter_py_filtered(
@@ -236,26 +400,86 @@ def _non_ignore(l: str) -> bool:
 # fmt: on
 
 
+## Same lines `_non_ignore` skips (blank, `#` comments, `!` negations), in one scan of the file
+_IGNORE_LINE_RE = re.compile(r"^(?![ \t]*(?:[#!]|\r?$))[^\r\n]+", re.MULTILINE)
+
+
 def iter_gitignore(
     path: Path | str, line_skip: Callable[[str], bool] = _non_ignore
 ) -> Iterable[str]:
     """Iterate over the lines in a .gitignore file with an optional filter view"""
+    if line_skip is _non_ignore:
+        text = Path(path).read_text()
+        yield from (m.group(0) for m in _IGNORE_LINE_RE.finditer(text))
+        return
     with open(path) as file:
-        for line in iter(file.readline, ""):
+        for line in file:
             if not line_skip(line):
-                yield line
+                yield line.rstrip("\r\n")
 
 
 T = TypeVar("T", str, Path)
 
 
+def check_ignored_many(root: Path, paths: Iterable[T]) -> dict[T, bool]:
+    """
+    Check a batch of paths against Git's ignore rules with a single `git check-ignore`.
+
+    Paths are fed through stdin (``--stdin -z``), so there is one subprocess
+    regardless of how many paths are passed and no argv length limit.
+
+    Args:
+        root : Path
+        Any path inside the target Git repository. Used to resolve repo root.
+        paths : Iterable[Path] | Iterable[str]
+        Paths to check against Git's ignore rules.
+
+    Returns:
+        Mapping of each given path to whether it is ignored.
+    """
+    return _check_ignored_batch(find_repo_root(root), paths)
+
+
+def _check_ignored_batch(start: Path, paths: Iterable[T]) -> dict[T, bool]:
+    if not (items := list(paths)):
+        return {}
+    if (backend := _libgit2_backend()) is not None:
+        return {p: backend.is_ignored(start, p) for p in items}
+    ## `os.fsencode` round-trips undecodable filenames; git echoes each matched path back as given
+    encoded = [os.fsencode(p) for p in items]
+    out = run_git(
+        start,
+        "check-ignore",
+        "--stdin",
+        "-z",
+        stdin=b"\0".join(encoded),
+        ok_codes=(0, 1),
+    )
+    ignored = frozenset(out.split(b"\0"))
+    return {p: e in ignored for p, e in zip(items, encoded, strict=True)}
+
+
+@lru_cache(maxsize=4096)
+def _check_ignored_cached(start: Path, path: str) -> bool:
+    """Single-path lookups are memoized, since hooks tend to re-check the same files"""
+    return _check_ignored_batch(start, (path,))[path]
+
+
+def clear_git_caches() -> None:
+    """Forget memoized repo roots and ignore checks (e.g. after editing a `.gitignore`)"""
+    _REPO_ROOT_CACHE.clear()
+    _check_ignored_cached.cache_clear()
+    if _libgit2 is not None:
+        _libgit2.clear()
+
+
 def check_ignored(root: Path, ignore: T | Collection[T]) -> set[T]:
     """
     Check whether given paths are ignored by Git.
 
     This function wraps `git check-ignore` and reports which of the provided
     paths are ignored according to the `.gitignore` configuration starting
-    from the repository root.
+    from the repository root. See ``check_ignored_many`` for the batched call.
 
     Args:
         root : Path
@@ -271,19 +495,20 @@ def check_ignored(root: Path, ignore: T | Collection[T]) -> set[T]:
 
     Example:
     ```pycon
-    >>> check_ignored(Path("."), "node_modules/")
-    {"node_modules/"}
+    >>> check_ignored(Path("."), "node_modules")
+    {"node_modules"}
     ```
 
     """
-    start = find_repo_root(root)
+    return check_ignored_at(find_repo_root(root), ignore)
+
+
+def check_ignored_at(repo_root: Path, ignore: T | Collection[T]) -> set[T]:
+    """Same as ``check_ignored``, for callers who already resolved ``repo_root`` with ``find_repo_root``"""
     if isinstance(ignore, (Path, str)):
-        result = run_git(start, "check-ignore", str(ignore))
-        if str(ignore) in result:
-            return {ignore}  # pyright: ignore[reportReturnType]
-        return set()
-    else:
-        result = run_git(start, "check-ignore", *(str(r) for r in ignore))
-        cls_ = next(iter(ignore)).__class__
-        result_set = {cls_(r) for r in result.splitlines()}
-        return result_set.intersection(ignore)
+        return {ignore} if _check_ignored_cached(repo_root, str(ignore)) else set()  # pyright: ignore[reportReturnType]
+    return {
+        p
+        for p, is_ignored in _check_ignored_batch(repo_root, ignore).items()
+        if is_ignored
+    }
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ruamel.yaml import YAML
+from useful_types import SequenceNotStr as Sequence
+
+## One loader shared by every test module
+YAML_LOADER = YAML()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from useful_types import SequenceNotStr as Sequence
+
+from ahooks.hooks.block_manual_req_edits import (
+    block_manual_req_edits,
+    is_manual_req_edit,
+)
+
+
+@pytest.mark.parametrize(
+    ("staged", "expected"),
+    (
+        ((), False),
+        (("requirements.txt",), True),
+        (("requirements.txt", "src/a.py"), True),
+        (("requirements.txt", "pyproject.toml"), False),
+        (("pyproject.toml",), False),
+        (("sub/requirements.txt",), False),
+    ),
+)
+def test_is_manual_req_edit(staged: tuple[str, ...], expected: bool):
+    assert is_manual_req_edit(staged) is expected
+
+
+@pytest.mark.parametrize(
+    ("staged", "exit_code"),
+    (
+        ((), 0),
+        (("requirements.txt",), 1),
+        (("requirements.txt", "pyproject.toml"), 0),
+    ),
+)
+def test_block_manual_req_edits(
+    git_repo: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    staged: tuple[str, ...],
+    exit_code: int,
+):
+    for name in staged:
+        _ = (git_repo / name).write_text("")
+    if staged:
+        _ = subprocess.run(["git", "add", *staged], cwd=git_repo, check=True)  # noqa: S607
+    monkeypatch.chdir(git_repo)
+
+    result = CliRunner().invoke(block_manual_req_edits, [])
+    assert result.exit_code == exit_code, result.output
+    if exit_code:
+        assert "don't hand-edit requirements.txt" in result.output
@@ -1,21 +1,19 @@
 from __future__ import annotations
 
+import subprocess
 import textwrap
 from pathlib import Path
 from typing import Any, NamedTuple
 
 import pytest
-from ruamel.yaml import YAML
 from useful_types import (
     SequenceNotStr as Sequence,  # pyright: ignore[reportUnusedImport]
 )
 
-yaml = YAML()
+from tests._yaml import YAML_LOADER as yaml
 
-
-@pytest.fixture(scope="session")
-def sample_toml_file() -> str:
-    s = textwrap.dedent("""
+## Immutable, so dedented once at import rather than per fixture setup
+_SAMPLE_TOML = textwrap.dedent("""
             [project]
         name = "test"
         version = "0.1.0"
@@ -31,27 +29,40 @@ def sample_toml_file() -> str:
         requires = ["hatchling"]
         build-backend = "hatchling.build"
     """)
-    return s
+
+
+@pytest.fixture(scope="session")
+def sample_toml_file() -> str:
+    return _SAMPLE_TOML
 
 
 class YamlFile(NamedTuple):
     path: Path
     data: Any
 
+    @classmethod
+    def load(cls, name: str) -> YamlFile:
+        """Load one of the expected-output files next to this conftest"""
+        path = Path(__file__).parent / name
+        with path.open("r") as file:
+            return cls(path, yaml.load(file))
+
 
 @pytest.fixture(scope="session")
 def expected_ahook_yaml() -> YamlFile:
     """Expected format of the `.pre-commit-config.yaml` output by `ahook.export.py`"""
-    path = Path(__file__).parent / ".test.pre-commit-config.yaml"
-    with path.open("r") as file:
-        data = yaml.load(file)
-    return YamlFile(path, data)
+    return YamlFile.load(".test.pre-commit-config.yaml")
 
 
 @pytest.fixture(scope="session")
 def expected_ahook_just_hooks_yaml() -> YamlFile:
     """Expected format of the `.pre-commit-hooks.yaml` output by `ahook.export.py`"""
-    path = Path(__file__).parent / ".test.pre-commit-hooks.yaml"
-    with path.open("r") as file:
-        data = yaml.load(file)
-    return YamlFile(path, data)
+    return YamlFile.load(".test.pre-commit-hooks.yaml")
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """An empty `git init` repo which ignores `*.log` and `build/`"""
+    _ = subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)  # noqa: S607
+    _ = (tmp_path / ".gitignore").write_text("*.log\nbuild/\n")
+    return tmp_path
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from useful_types import SequenceNotStr as Sequence
+
+from ahooks.hooks.emit_requirements import (
+    _dep_type_of,
+    _get_dep_type,
+    _get_dep_type_cached,
+    _TestDepsType,
+)
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+
+@pytest.mark.parametrize(
+    ("extra", "expected"),
+    (
+        ("", None),
+        ('[dependency-groups]\ntest = ["pytest"]\n', _TestDepsType.GROUP),
+        ('[project.optional-dependencies]\ntest = ["pytest"]\n', _TestDepsType.EXTRA),
+    ),
+)
+def test_dep_type_of(
+    sample_toml_file: str, extra: str, expected: _TestDepsType | None
+) -> None:
+    assert _dep_type_of(tomllib.loads(sample_toml_file + extra)) is expected
+
+
+def test_get_dep_type_reparses_only_on_change(sample_toml_file: str, tmp_path: Path):
+    _get_dep_type_cached.cache_clear()
+    _ = (path := tmp_path / "pyproject.toml").write_text(sample_toml_file)
+
+    assert _get_dep_type(path) is None
+    assert _get_dep_type(path) is None
+    assert _get_dep_type_cached.cache_info().hits == 1
+
+    _ = path.write_text(sample_toml_file + '[dependency-groups]\ntest = ["pytest"]\n')
+    assert _get_dep_type(path) is _TestDepsType.GROUP
+    assert _get_dep_type_cached.cache_info().misses == 2
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import textwrap
+from pathlib import Path
+
+import pytest
+from useful_types import SequenceNotStr as Sequence
+
+from ahooks.hooks.env_skeleton import _HEADER, _iter_env_var_names, build_skeleton
+
+_ENV = textwrap.dedent("""\
+    # comment
+    FOO=1
+
+      BAR=two=2
+    export BAZ="3"
+    export  QUX=4
+    export\tQUUX=5
+    NOT_A_VAR
+        # indented comment
+    """)
+
+
+@pytest.mark.parametrize(
+    ("include_eq_sign", "strip_export", "expected"),
+    (
+        (True, True, ["FOO=", "BAR=", "BAZ=", "QUX=", "QUUX="]),
+        (False, True, ["FOO", "BAR", "BAZ", "QUX", "QUUX"]),
+        (
+            True,
+            False,
+            ["FOO=", "BAR=", "export BAZ=", "export QUX=", "export QUUX="],
+        ),
+    ),
+)
+def test_iter_env_var_names(
+    tmp_path: Path, include_eq_sign: bool, strip_export: bool, expected: list[str]
+):
+    _ = (env := tmp_path / ".env").write_text(_ENV)
+    assert list(_iter_env_var_names(env, include_eq_sign, strip_export)) == expected
+
+
+def test_build_skeleton(tmp_path: Path):
+    _ = (env := tmp_path / ".env").write_text(_ENV + "FOO=again\n")
+    assert build_skeleton(env) == _HEADER + "BAR=\nBAZ=\nFOO=\nQUUX=\nQUX=\n"
@@ -3,19 +3,15 @@
 
 from __future__ import annotations
 
-import os
-import shutil
-import typing
-import uuid
-from collections.abc import Collection, Iterable
-from itertools import chain
+from collections.abc import Collection
+from itertools import combinations
+from operator import attrgetter
 from pathlib import Path
 from typing import TypedDict
 
 import pytest
 from click.testing import CliRunner, Result
-from hypothesis import HealthCheck, given, settings
-from ruamel.yaml import YAML
+from hypothesis import given
 from typing_extensions import NotRequired, Unpack
 from useful_types import SequenceNotStr as Sequence
 
@@ -28,9 +24,7 @@ from ahooks.models import (
     load_config,
     load_hooks,
 )
-from tests.strategies import hook_choice_strat
-
-yaml = YAML()
+from tests.strategies import HOOK_CHOICES, hook_choice_strat
 
 
 def _check_yaml_vs_expected(
@@ -62,6 +56,9 @@ def _check(output: Path, expected: PreCommitConfigYaml, hooks_only: bool) -> Non
         _check_hooks_vs_expected(loaded_output_hooks, expected.repos[0].hooks)  # pyright: ignore[reportArgumentType]
 
 
+_RUNNER = CliRunner()
+
+
 class _CallExportKwargs(TypedDict, total=False):
     hooks: NotRequired[Collection[HookChoice]]
     config_path: NotRequired[Path]
@@ -75,32 +72,29 @@ def _call_export(**kwargs: Unpack[_CallExportKwargs]) -> Result:
 
     args: list[str] = []
     if hooks:
-        args += list(chain.from_iterable(("-k", h) for h in hooks))
+        args += [arg for h in hooks for arg in ("-k", h)]
     if config_path:
         args += ["-o", str(config_path)]
     if hooks_only:
         args += ["-h"]
 
-    runner = CliRunner()
-    result = runner.invoke(export, args, standalone_mode=False)
+    result = _RUNNER.invoke(export, args, standalone_mode=False)
     assert result.exit_code == 0, result.output
     return result
 
 
-def _iter_hook_choices() -> Iterable[HookChoice]:
-    for lit in typing.get_args(HookChoice):
-        yield typing.get_args(lit)[0]
+_ID = attrgetter("id")
 
 
 def _ahook_runner(config: PreCommitConfigYaml, *obj: HookChoice) -> None:
     if not obj:
-        obj = tuple(_iter_hook_choices())
+        obj = HOOK_CHOICES
 
     ## The hypothesis strategy can generate duplicate hook choices
     # Ensure that the generating function handles this
     de_duped = list(set(obj))
 
-    given, exp = sorted(config.repos[0].hooks, key=lambda h: h.id), sorted(de_duped)
+    given, exp = sorted(config.repos[0].hooks, key=_ID), sorted(de_duped)
     assert len(given) == len(exp)
     # assert config.repos[0].hooks == obj # wrong -- obj is just the list of ids/names
     for n, _ in enumerate(given):
@@ -120,35 +114,38 @@ def test_get_ahook_config_no_hooks_given():
     _ahook_runner(config)
 
 
-def _export_runner(hooks_only: bool, given_hooks: list[HookChoice] | None) -> None:
-    output = (
-        Path(__file__).parent
-        / "example_exports"
-        / f"{uuid.uuid4()}"
-        / ".pre-commit-config.yaml"
-    )
-    os.mkdir(output.parent)
-    try:
-        expected = get_ahook_config(*given_hooks) if given_hooks else get_ahook_config()
-        kwargs: _CallExportKwargs = {
-            "config_path": output,
-            "hooks_only": hooks_only,
-        }
-        if given_hooks:
-            kwargs["hooks"] = given_hooks
-        _res = _call_export(**kwargs)
-        _check(output, expected, hooks_only)
-    finally:
-        shutil.rmtree(output.parent)
-
-
-@given(obj=hook_choice_strat().filter(lambda x: "block-manual-req-edits" not in x))
+def _export_runner(
+    tmp_dir: Path, hooks_only: bool, given_hooks: list[HookChoice] | None
+) -> None:
+    output = tmp_dir / ".pre-commit-config.yaml"
+    expected = get_ahook_config(*given_hooks) if given_hooks else get_ahook_config()
+    kwargs: _CallExportKwargs = {
+        "config_path": output,
+        "hooks_only": hooks_only,
+    }
+    if given_hooks:
+        kwargs["hooks"] = given_hooks
+    _res = _call_export(**kwargs)
+    _check(output, expected, hooks_only)
+
+
+_EXPORTABLE_HOOKS = tuple(h for h in HOOK_CHOICES if h != "block-manual-req-edits")
+## Every non-empty subset, so each combination is covered deterministically
+_ALL_HOOK_SUBSETS = [
+    list(s)
+    for k in range(1, len(_EXPORTABLE_HOOKS) + 1)
+    for s in combinations(_EXPORTABLE_HOOKS, k)
+]
+
+
+@pytest.mark.parametrize("obj", _ALL_HOOK_SUBSETS, ids="+".join)
 @pytest.mark.parametrize("hooks_only", (True, False))
-@settings(suppress_health_check=[HealthCheck.function_scoped_fixture], max_examples=10)
-def test_export_given_hooks(hooks_only: bool, obj: list[HookChoice]) -> None:
-    _export_runner(hooks_only, obj)
+def test_export_given_hooks(
+    hooks_only: bool, obj: list[HookChoice], tmp_path: Path
+) -> None:
+    _export_runner(tmp_path, hooks_only, obj)
 
 
 @pytest.mark.parametrize("hooks_only", (True, False))
-def test_export_no_hooks_given(hooks_only: bool) -> None:
-    _export_runner(hooks_only, given_hooks=None)
+def test_export_no_hooks_given(hooks_only: bool, tmp_path: Path) -> None:
+    _export_runner(tmp_path, hooks_only, given_hooks=None)
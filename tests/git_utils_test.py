@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+from useful_types import SequenceNotStr as Sequence
+
+from ahooks.utils import git_utils
+from ahooks.utils.git_utils import (
+    DiffFilter,
+    GitSubProcessFailed,
+    check_ignored,
+    check_ignored_many,
+    clear_git_caches,
+    find_repo_root,
+    iter_gitignore,
+    iter_py_git_diff,
+    iter_py_git_diff_at,
+    run_git,
+)
+
+
+@pytest.fixture(autouse=True, params=("libgit2", "subprocess"))
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each test against both the opt-in `pygit2` backend (if installed) and plain `git`"""
+    if request.param == "libgit2":
+        if git_utils.pygit2 is None:
+            pytest.skip("pygit2 not installed")
+        monkeypatch.setattr(git_utils, "_libgit2", git_utils._Libgit2Backend())
+    else:
+        monkeypatch.setattr(git_utils, "_libgit2", None)
+    monkeypatch.delenv("GIT_INDEX_FILE", raising=False)
+    clear_git_caches()
+    return request.param
+
+
+def _git(repo: Path, *args: str, env: dict[str, str] | None = None) -> None:
+    _ = subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],  # noqa: S607
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        env={**os.environ, **env} if env else None,
+    )
+
+
+def test_check_ignored_many(git_repo: Path):
+    paths = ["a.log", "a.py", "build/out.txt", "src/b.log"]
+    assert check_ignored_many(git_repo, paths) == {
+        "a.log": True,
+        "a.py": False,
+        "build/out.txt": True,
+        "src/b.log": True,
+    }
+
+
+def test_check_ignored_skips_tracked(git_repo: Path):
+    for name in ("keep.log", "other.log"):
+        _ = (git_repo / name).write_text("")
+    _git(git_repo, "add", "-f", "keep.log")
+    assert check_ignored(git_repo, "keep.log") == set()
+    assert check_ignored(git_repo, ["keep.log", "other.log"]) == {"other.log"}
+    ## Any spelling `git check-ignore` accepts
+    for spelling in (git_repo / "keep.log", "./keep.log", "build/../keep.log"):
+        assert check_ignored(git_repo, spelling) == set()
+    assert check_ignored(git_repo, git_repo / "other.log") == {git_repo / "other.log"}
+
+
+def test_check_ignored_many_non_ascii(git_repo: Path):
+    paths = [Path("ñ dir/é.log"), Path("ñ dir/é.py")]
+    assert check_ignored_many(git_repo, paths) == {paths[0]: True, paths[1]: False}
+
+
+def test_check_ignored_empty_skips_git(git_repo: Path, monkeypatch: pytest.MonkeyPatch):
+    def _fail(*args: object, **kwargs: object) -> bytes:
+        pytest.fail("git should not run")
+
+    monkeypatch.setattr(git_utils, "run_git", _fail)
+    assert check_ignored_many(git_repo, []) == {}
+    assert check_ignored(git_repo, []) == set()
+
+
+def test_run_git_failure_decodes_stderr(git_repo: Path):
+    with pytest.raises(GitSubProcessFailed, match="not-a-ref"):
+        _ = run_git(git_repo, "rev-parse", "--verify", "not-a-ref")
+
+
+def test_check_ignored_none_matched(git_repo: Path):
+    assert check_ignored(git_repo, Path("a.py")) == set()
+    assert check_ignored(git_repo, [Path("a.py"), Path("b.py")]) == set()
+
+
+def test_check_ignored_single_is_memoized(git_repo: Path):
+    assert check_ignored(git_repo, "a.log") == {"a.log"}
+    _ = (git_repo / ".gitignore").write_text("")
+    assert check_ignored(git_repo, "a.log") == {"a.log"}
+    clear_git_caches()
+    assert check_ignored(git_repo, "a.log") == set()
+
+
+def test_check_ignored_single(git_repo: Path):
+    assert check_ignored(git_repo, "a.log") == {"a.log"}
+    assert check_ignored(git_repo, [Path("a.log"), Path("a.py")]) == {Path("a.log")}
+
+
+def test_find_repo_root(git_repo: Path):
+    (sub := git_repo / "a" / "b").mkdir(parents=True)
+    assert find_repo_root(sub).resolve() == git_repo.resolve()
+
+
+def test_iter_py_git_diff_staged(git_repo: Path):
+    for name in ("a.py", "b.py", "c.txt"):
+        _ = (git_repo / name).write_text("x = 1\n")
+    _git(git_repo, "add", ".")
+    _git(git_repo, "commit", "-qm", "init")
+
+    _ = (git_repo / "a.py").write_text("x = 2\n")
+    (git_repo / "pkg").mkdir()
+    _ = (git_repo / "pkg" / "d.py").write_text("x = 1\n")
+    _git(git_repo, "add", "a.py", "pkg/d.py")
+    _git(git_repo, "rm", "-q", "b.py")
+
+    changed = {
+        p.relative_to(git_repo.resolve()) for p in iter_py_git_diff(git_repo.resolve())
+    }
+    assert changed == {Path("a.py"), Path("pkg/d.py")}
+    ## Paths are relative to the repo root even when starting from a subdirectory
+    from_sub = set(iter_py_git_diff(git_repo.resolve() / "pkg"))
+    assert from_sub == {git_repo.resolve() / p for p in changed}
+
+
+def test_iter_py_git_diff_honours_git_index_file(
+    git_repo: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """`git commit -a` / `git commit <path>` run hooks against a temporary index"""
+    _ = (git_repo / "a.py").write_text("x = 1\n")
+    _git(git_repo, "add", "a.py")
+    _git(git_repo, "commit", "-qm", "init")
+
+    _ = (git_repo / "a.py").write_text("x = 2\n")
+    alt = {"GIT_INDEX_FILE": str(git_repo / ".git" / "alt-index")}
+    _git(git_repo, "read-tree", "HEAD", env=alt)
+    _git(git_repo, "add", "a.py", env=alt)
+
+    assert list(iter_py_git_diff(git_repo)) == []
+    monkeypatch.setenv("GIT_INDEX_FILE", alt["GIT_INDEX_FILE"])
+    assert list(iter_py_git_diff(git_repo)) == [git_repo.resolve() / "a.py"]
+
+
+def test_iter_py_git_diff_detects_renames(git_repo: Path):
+    _ = (git_repo / "a.py").write_text("x = 1\n")
+    _git(git_repo, "add", "a.py")
+    _git(git_repo, "commit", "-qm", "init")
+    _git(git_repo, "mv", "a.py", "b.py")
+
+    renamed = iter_py_git_diff(git_repo, diff_filter=DiffFilter("R"))
+    assert list(renamed) == [git_repo.resolve() / "b.py"]
+    assert list(iter_py_git_diff(git_repo, diff_filter=DiffFilter("A"))) == []
+
+
+def test_iter_py_git_diff_at_relative_root(
+    git_repo: Path, monkeypatch: pytest.MonkeyPatch
+):
+    _ = (git_repo / "a.py").write_text("")
+    _git(git_repo, "add", "a.py")
+    monkeypatch.chdir(git_repo)
+    assert list(iter_py_git_diff_at(Path("."))) == [git_repo.resolve() / "a.py"]
+
+
+def test_iter_gitignore(tmp_path: Path):
+    _ = (gitignore := tmp_path / ".gitignore").write_text(
+        "# comment\n*.log\n\n   \n!keep.log\n  # indented\nbuild/\r\n.venv\n"
+    )
+    assert list(iter_gitignore(gitignore)) == ["*.log", "build/", ".venv"]
+    assert list(iter_gitignore(gitignore, lambda l: not l.startswith("*"))) == ["*.log"]
+
+
+def test_find_repo_root_shares_cache_across_spellings(
+    git_repo: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(git_repo)
+    root = find_repo_root(Path("."))
+    assert find_repo_root(git_repo) == root
+    assert find_repo_root(git_repo / "sub" / "..") == root
+    assert len(git_utils._REPO_ROOT_CACHE) == 1
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from pathlib import Path
 
 import pytest
@@ -11,31 +12,44 @@ from ahooks.models import (
     RepoConfigBlock,
     conv,
     dump_config,
+    get_ahook_config,
     load_config,
     load_hooks,
 )
 from tests.conftest import YamlFile
 
 
+@pytest.fixture(scope="session")
+def loaded_ahook_config(expected_ahook_yaml: YamlFile) -> PreCommitConfigYaml:
+    """`expected_ahook_yaml` structured once per session; tests only re-dump it"""
+    return load_config(expected_ahook_yaml.path)
+
+
+@pytest.fixture(scope="session")
+def loaded_ahook_hooks(expected_ahook_just_hooks_yaml: YamlFile) -> PreCommitConfigYaml:
+    """`expected_ahook_just_hooks_yaml` structured once per session and wrapped in a config"""
+    hooks = load_hooks(expected_ahook_just_hooks_yaml.path)
+    return PreCommitConfigYaml(repos=[RepoConfigBlock("local", hooks)])  # pyright: ignore[reportArgumentType]
+
+
 @pytest.mark.parametrize("hooks_only", (True, False))
 def test_roundtrip_yaml(
+    request: pytest.FixtureRequest,
     expected_ahook_yaml: YamlFile,
     expected_ahook_just_hooks_yaml: YamlFile,
     hooks_only: bool,
-    tmpdir,
 ):
     """Test that reading yaml and dumping yaml matches given file format"""
     if not hooks_only:
         expected = expected_ahook_yaml
-        res = load_config(expected.path)
+        res = request.getfixturevalue("loaded_ahook_config")
         assert isinstance(res, PreCommitConfigYaml)
         dump_config(
             res, (new := (Path(__file__).parent / "temp-config.yaml")), hooks_only
         )
     else:
         expected = expected_ahook_just_hooks_yaml
-        hooks = load_hooks(expected.path)
-        res = PreCommitConfigYaml(repos=[RepoConfigBlock("local", hooks)])  # pyright: ignore[reportArgumentType]
+        res = request.getfixturevalue("loaded_ahook_hooks")
         dump_config(
             res, (new := (Path(__file__).parent / "temp-hooks.yaml")), hooks_only
         )
@@ -43,45 +57,54 @@ def test_roundtrip_yaml(
     assert expected.path.read_text() == new.read_text()
 
 
+_TEST_HOOKS_DATA = [
+    {
+        "id": "add-from-future",
+        "name": "Add `from __future__ import annotations` to `.py` files.",
+        "language": "python",
+        "entry": "python -m ahooks.add_from_future",
+        "args": ["-ds"],
+        "pass_filenames": False,
+        "files": "^.*\\.py$",
+        "stages": ["pre-commit"],
+    },
+    {
+        "id": "block-manual-req-edits",
+        "name": "Block manual edits to requirements.txt",
+        "language": "system",
+        "entry": "python -m ahooks.block_manual_req_edits",
+        "pass_filenames": False,
+        "files": "^requirements\\.txt$",
+        "stages": ["pre-commit", "pre-push"],
+    },
+    {
+        "id": "emit-requirements",
+        "name": "Emit requirements.txt from pyproject.toml using `uv`",
+        "language": "system",
+        "entry": "python -m ahooks.emit_requirements",
+        "pass_filenames": False,
+        "files": "^(pyproject\\.toml|requirements\\.txt)$",
+        "stages": ["pre-commit", "pre-push"],
+    },
+    {
+        "id": "env-skeleton",
+        "name": "Create an example `.env` file with only the names of variables",
+        "language": "system",
+        "entry": "python -m ahooks.env_skeleton",
+        "args": [".", ".env", "."],
+        "pass_filenames": False,
+        "stages": ["pre-commit", "pre-push"],
+    },
+]
+
+
+## The package's own hooks, ordered like `_TEST_HOOKS_DATA`.
+# Taken at import: structuring a hook also registers it (first id wins), so
+# `test_roundtrip_yaml` would otherwise get its file's blocks registered first
+_REGISTERED_HOOKS = sorted(get_ahook_config().repos[0].hooks, key=attrgetter("id"))
+
+
 def test_res_hooks_only():
-    data = [
-        {
-            "id": "add-from-future",
-            "name": "Add `from __future__ import annotations` to `.py` files.",
-            "language": "python",
-            "entry": "python -m ahooks.add_from_future",
-            "args": ["-ds"],
-            "pass_filenames": False,
-            "files": "^.*\\.py$",
-            "stages": ["pre-commit"],
-        },
-        {
-            "id": "block-manual-req-edits",
-            "name": "Block manual edits to requirements.txt",
-            "language": "system",
-            "entry": '\n     bash -c\n            if git diff --cached --name-only | grep -q "^requirements\\.txt$" &&\n                ! git diff --cached --name-only | grep -q "^pyproject\\.toml$"; then\n                echo "Edit pyproject.toml and run the emitter; don\'t hand-edit requirements.txt."\n                exit 1\n            fi\n    ',
-            "pass_filenames": False,
-            "files": "^requirements\\.txt$",
-            "stages": ["pre-commit", "pre-push"],
-        },
-        {
-            "id": "emit-requirements",
-            "name": "Emit requirements.txt from pyproject.toml using `uv`",
-            "language": "system",
-            "entry": "python -m ahooks.emit_requirements",
-            "pass_filenames": False,
-            "files": "^(pyproject\\.toml|requirements\\.txt)$",
-            "stages": ["pre-commit", "pre-push"],
-        },
-        {
-            "id": "env-skeleton",
-            "name": "Create an example `.env` file with only the names of variables",
-            "language": "system",
-            "entry": "python -m ahooks.env_skeleton",
-            "args": [".", ".env", "."],
-            "pass_filenames": False,
-            "stages": ["pre-commit", "pre-push"],
-        },
-    ]
-
-    _ = conv.structure(data, list[HookConfigBlock])
+    _ = conv.structure(_TEST_HOOKS_DATA, list[HookConfigBlock])
+    ## `HookConfigBlock.__eq__` only compares ids; unstructure to compare every field
+    assert conv.unstructure(_REGISTERED_HOOKS) == _TEST_HOOKS_DATA
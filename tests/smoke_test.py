@@ -1,35 +1,36 @@
-"""Enabling runtime type-checking on all tests with beartype_package("ahooks")"""
+"""Import every module under beartype_package("ahooks") in a fresh interpreter"""
 
 from __future__ import annotations
 
-import importlib
-import pkgutil
-from collections.abc import Iterator
+import subprocess
+import sys
+import textwrap
 
-from beartype.claw import beartype_package
 from useful_types import SequenceNotStr as Sequence
 
-beartype_package("ahooks")
+## `beartype_package` installs a process-wide import hook and only instruments modules imported after it,
+# so the check runs in a child process where no `ahooks` module has been imported yet
+_IMPORT_ALL = textwrap.dedent("""
+    import importlib
+    import pkgutil
 
+    from beartype.claw import beartype_package
 
-def _iter_modules() -> Iterator[pkgutil.ModuleInfo]:
+    beartype_package("ahooks")
     pkg = importlib.import_module("ahooks")
-    return pkgutil.walk_packages(pkg.__path__, pkg.__name__ + ".")
-
-
-def test_import_all_package_modules():
-    """Iterate over all package modules and dyanmically import"""
-
-    def import_error(name: str) -> Exception | None:
+    errors = {}
+    for mod in pkgutil.walk_packages(pkg.__path__, pkg.__name__ + "."):
         try:
-            _ = importlib.import_module(name)
+            importlib.import_module(mod.name)
         except Exception as e:
-            return e
+            errors[mod.name] = repr(e)
+    assert not errors, f"Failed imports: {errors}"
+""")
 
-    import_errors = {
-        mod.name: mod_error
-        for mod in _iter_modules()
-        if (mod_error := import_error(mod.name)) is not None
-    }
 
-    assert not import_errors, f"Failed imports: {import_errors}"
+def test_import_all_package_modules():
+    """Iterate over all package modules and dyanmically import"""
+    res = subprocess.run(
+        [sys.executable, "-c", _IMPORT_ALL], capture_output=True, text=True
+    )
+    assert res.returncode == 0, res.stderr
@@ -8,7 +8,11 @@ from useful_types import SequenceNotStr as Sequence
 
 from ahooks._types import HookChoice
 
+## Every `HookChoice` id, unpacked from its `Literal`s once at import
+HOOK_CHOICES: tuple[HookChoice, ...] = tuple(
+    t.get_args(h)[0] for h in t.get_args(HookChoice)
+)
+
 
 def hook_choice_strat() -> SearchStrategy[list[HookChoice]]:
-    choices = tuple(t.get_args(h)[0] for h in t.get_args(HookChoice))
-    return st.lists(st.sampled_from(choices), min_size=1, max_size=3)
+    return st.lists(st.sampled_from(HOOK_CHOICES), min_size=1, max_size=3)